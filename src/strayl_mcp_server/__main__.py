@@ -1,10 +1,18 @@
 """Entry point for the Strayl MCP server."""
 
+try:
+    # Not available on Windows; the default event loop is used there
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .server import mcp
 
 
 def main():
     """Run the Strayl MCP server."""
+    if uvloop is not None:
+        uvloop.install()
     mcp.run()
 
 
@@ -1,17 +1,35 @@
 """Strayl MCP Server - Log search tools."""
 
+import asyncio
+import atexit
+import functools
+import io
 import os
+import sys
+import time
+import traceback
+from itertools import islice
 from typing import Annotated, Optional
 import httpx
+import msgspec
+import orjson
 from mcp.server.fastmcp import FastMCP
 
-from .utils import parse_time_period, format_log_result, format_documentation_result
+try:
+    # Optional accelerator: incremental JSON parsing for large index responses
+    import ijson
+except ImportError:
+    ijson = None
+
+from .utils import format_timestamp, parse_time_period, format_log_result, format_documentation_result
 
 # Initialize FastMCP server
 mcp = FastMCP(
     "Strayl Search",
     dependencies=[
-        "httpx>=0.27.0",
+        "httpx[http2]>=0.27.0",
+        "msgspec>=0.18",
+        "orjson>=3.10",
         "python-dateutil>=2.8.0",
     ]
 )
@@ -21,8 +39,148 @@ mcp = FastMCP(
 STRAYL_API_URL = "https://ougtygyvcgdnytkswier.supabase.co/functions/v1"
 
 
-def get_api_key() -> str:
-    """Get API key from environment variable."""
+class _LogSearchResponse(msgspec.Struct):
+    """Typed view of the /search-logs and /exact-search-logs responses.
+
+    Decoding straight into a struct is faster than a dict plus .get chains,
+    and field access is C-level attribute lookup.
+    """
+
+    success: bool = False
+    error: Optional[str] = None
+    results: list[dict] = []
+    total_results: int = 0
+    search_metadata: dict = {}
+
+
+# Valid log levels for search_logs_exact
+_VALID_LEVELS = frozenset({"info", "warn", "error", "debug"})
+
+# Separator lines reused by the result formatters
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+
+# Per-record templates: one format() call per record instead of many appends
+_SOURCE_TMPL = "{i}. {name}\n   ID: {sid}\n   URL: {url}\n   Status: {status}\n   Public: {pub}{chunks}{indexed}\n"
+_MEMORY_TMPL = "{i}. {title}\n   ID: {mid}{source}{updated}\n"
+
+# Constant framing of the listing outputs, assembled once at import so the
+# per-call work is limited to the variable middle
+_SOURCES_BANNER = f"{_SEP80}\nAVAILABLE DOCUMENTATION SOURCES\n{_SEP80}\n"
+_SOURCES_FOOTER = (
+    f"\n{_SEP80}\n"
+    "\nTip: Use source_id to search within a specific context source\n"
+    "   Example: search_context('query', source_id='uuid-here')"
+)
+_MEMORIES_BANNER = f"{_SEP80}\nYOUR CONTEXT MEMORIES\n{_SEP80}\n"
+_MEMORIES_FOOTER = (
+    f"\n{_SEP80}\n"
+    "\nTip: Use memory_id with search_context to continue conversation\n"
+    "   Example: search_context('query', memory_id='uuid-here')"
+)
+
+_TIME_PERIODS_HELP = """Supported time periods for log search:
+
+Minutes:
+  - 5m, 5_minutes, 5_mins - Last 5 minutes
+  - 10m, 10_minutes - Last 10 minutes
+  - 15m, 15_minutes - Last 15 minutes
+  - 30m, 30_minutes - Last 30 minutes
+
+Hours:
+  - 1h, 1_hour - Last 1 hour
+  - 2h, 2_hours - Last 2 hours
+  - 6h, 6_hours - Last 6 hours
+  - 12h, 12_hours - Last 12 hours
+  - 24h, last_24_hours - Last 24 hours
+
+Days:
+  - today - Today from 00:00 UTC
+  - yesterday - Full yesterday (00:00 to 23:59)
+  - 7d, last_7_days - Last 7 days
+  - 30d, last_30_days - Last 30 days
+
+Examples:
+  - search_logs_semantic("error connecting to database", "1h")
+  - search_logs_exact("timeout", "today", level="error")
+"""
+
+# Shared HTTP client: keep-alive and HTTP/2 multiplexing avoid a fresh
+# DNS + TCP + TLS handshake on every tool call.
+_CLIENT = httpx.AsyncClient(
+    base_url=STRAYL_API_URL,
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0),
+    headers={"Content-Type": "application/json"},
+)
+
+
+def _close_client() -> None:
+    """Close the shared client when the server process exits."""
+    try:
+        asyncio.run(_CLIENT.aclose())
+    except RuntimeError:
+        pass
+
+
+atexit.register(_close_client)
+
+
+def _http_error(response: httpx.Response) -> str:
+    """Build the error string for a non-2xx response.
+
+    The body is only decoded here, on the error path; success responses
+    never pay the content-type lookup or a second parse.
+    """
+    detail = None
+    if response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            detail = orjson.loads(response.content).get("error")
+        except Exception:
+            detail = None
+    if detail is None:
+        # Cap the fallback decode: a 500 can carry a large HTML page, and
+        # only the first bytes are useful in a one-line error message.
+        detail = response.content[:512].decode("utf-8", "replace")
+    return f"Error: API returned status {response.status_code}: {detail}"
+
+
+def _tool_errors(fn):
+    """Catch anything that escapes a tool's formatting path.
+
+    Transport failures are already turned into strings inside _call_api;
+    this keeps an unexpected formatting bug from surfacing as a protocol
+    error instead of a readable tool result.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except httpx.TimeoutException:
+            return "Error: Request timed out. Please try again."
+        except Exception as e:
+            return _unexpected_error(e)
+
+    return wrapper
+
+
+def _unexpected_error(e: Exception) -> str:
+    """Format an unexpected exception for the model.
+
+    Full tracebacks allocate, walk frames and leak internal paths, so they
+    are only produced when STRAYL_DEBUG is set.
+    """
+    if os.getenv("STRAYL_DEBUG"):
+        return f"Error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+    return f"Error: {str(e)}"
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_header() -> dict:
+    """Build the Authorization header once; the API key cannot change at runtime."""
     api_key = os.getenv("STRAYL_API_KEY", "")
 
     if not api_key:
@@ -31,10 +189,348 @@ def get_api_key() -> str:
             "Get your API key from https://strayl.dev"
         )
 
-    return api_key
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+@functools.lru_cache(maxsize=1)
+def _install_auth_header() -> None:
+    """Attach the Authorization header to the shared client's defaults.
+
+    Runs once on the first request; afterwards no per-call headers kwarg is
+    needed at all. Raises ValueError until STRAYL_API_KEY is set.
+    """
+    _CLIENT.headers.update(_auth_header())
+
+
+def _format_source(i: int, source: dict) -> str:
+    """Render a single context source record for list output."""
+    indexed_at = source.get("indexed_at", "")
+    date_str = ""
+    if indexed_at:
+        try:
+            date_str = format_timestamp(indexed_at)
+        except:
+            date_str = indexed_at[:10]
+
+    chunks_count = source.get("chunks_count", 0)
+    return _SOURCE_TMPL.format(
+        i=i,
+        name=source.get("name", "Unnamed"),
+        sid=source.get("id", "Unknown"),
+        url=source.get("url", "N/A"),
+        status=source.get("status", "unknown").upper(),
+        pub="Yes" if source.get("is_public", False) else "No (Your private source)",
+        chunks=f"\n   Chunks: {chunks_count}" if chunks_count else "",
+        indexed=f"\n   Indexed: {date_str}" if date_str else "",
+    )
+
+
+def _format_memory(i: int, chat: dict) -> str:
+    """Render a single memory session record for list output."""
+    updated = chat.get("updated_at", "")
+    date_str = ""
+    if updated:
+        try:
+            date_str = format_timestamp(updated)
+        except:
+            date_str = updated[:16]
+
+    source = chat.get("documentation_sources")
+    return _MEMORY_TMPL.format(
+        i=i,
+        title=chat.get("title", "Untitled"),
+        mid=chat.get("id", "Unknown"),
+        source=f"\n   Source: {source.get('name', 'N/A')}" if source else "",
+        updated=f"\n   Updated: {date_str}" if date_str else "",
+    )
+
+
+async def _post_json(
+    client: httpx.AsyncClient,
+    url: str,
+    content: Optional[bytes],
+    timeout: Optional[float] = None,
+) -> httpx.Response:
+    """POST pre-encoded JSON content and return the raw httpx response."""
+    return await client.post(
+        url,
+        content=content,
+        timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+    )
+
+
+# Formatted responses of the read-only listing tools change on human
+# timescales, yet agents re-request them before nearly every search.
+# Cache them briefly; write paths invalidate.
+_LIST_CACHE: dict = {}
+_LIST_CACHE_TTL = 60.0
+
+
+def _list_cache_get(key):
+    """Return a cached listing if present and fresh, else None."""
+    entry = _LIST_CACHE.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if time.monotonic() >= expires:
+        _LIST_CACHE.pop(key, None)
+        return None
+    return value
+
+
+def _list_cache_put(key, value) -> None:
+    _LIST_CACHE[key] = (time.monotonic() + _LIST_CACHE_TTL, value)
+
+
+# Search calls with identical arguments repeat within seconds (agent retry
+# loops, a user paging back and forth), so briefly cache the fully formatted
+# response keyed on the arguments. A hit skips the round trip and the
+# decode/format path entirely. Bounded LRU: dicts keep insertion order, so
+# evicting the first key drops the least recently used entry.
+_SEARCH_CACHE: dict = {}
+_SEARCH_CACHE_TTL = 30.0
+_SEARCH_CACHE_MAX = 256
+
+
+def _search_cache_get(key):
+    """Return a cached search response if present and fresh, else None."""
+    entry = _SEARCH_CACHE.pop(key, None)
+    if entry is None:
+        return None
+    expires, value = entry
+    if time.monotonic() >= expires:
+        return None
+    _SEARCH_CACHE[key] = entry  # reinsert on hit to keep LRU order
+    return value
+
+
+def _search_cache_put(key, value) -> None:
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+        del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+    _SEARCH_CACHE[key] = (time.monotonic() + _SEARCH_CACHE_TTL, value)
+
+
+# Read-only search endpoints where identical concurrent requests (agent
+# retry loops, multi-tool fan-out with the same query) can safely share a
+# single in-flight POST instead of each paying a round trip. Distinct
+# concurrent requests already multiplex over the shared HTTP/2 client.
+_COALESCE_ENDPOINTS = frozenset({"/search-logs", "/exact-search-logs"})
+_INFLIGHT: dict = {}
+
+# One-shot STRAYL_DEBUG confirmation that HTTP/2 was actually negotiated
+_HTTP_VERSION_LOGGED = False
+
+
+def _log_http_version(response: httpx.Response) -> None:
+    global _HTTP_VERSION_LOGGED
+    if not _HTTP_VERSION_LOGGED and os.getenv("STRAYL_DEBUG"):
+        # stderr only: stdout carries the MCP stdio framing
+        print(f"Strayl API negotiated {response.http_version}", file=sys.stderr)
+        _HTTP_VERSION_LOGGED = True
+
+
+async def _call_api(
+    endpoint: str,
+    payload: Optional[dict],
+    timeout: Optional[float] = None,
+    timeout_msg: str = "Error: Request timed out. Please try again.",
+    type_: Optional[type] = None,
+):
+    """POST to the Strayl API and return (data, None) or (None, error message).
+
+    Every transport-level failure - missing API key, timeout, non-200
+    status, unexpected exception - is converted into the error string the
+    tools hand back to the model, so each tool keeps a single success path.
+    Identical concurrent calls to coalescible endpoints share one request.
+    """
+    content = orjson.dumps(payload) if payload is not None else None
+
+    if endpoint not in _COALESCE_ENDPOINTS or content is None:
+        return await _request(endpoint, content, timeout, timeout_msg, type_)
+
+    key = (endpoint, content)
+    task = _INFLIGHT.get(key)
+    if task is not None:
+        return await task
+
+    task = asyncio.ensure_future(_request(endpoint, content, timeout, timeout_msg, type_))
+    _INFLIGHT[key] = task
+    try:
+        return await task
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+# Keys actually displayed by index_context; everything else in the
+# (potentially multi-megabyte) indexing response is dropped as it streams in.
+_INDEX_SUMMARY_KEYS = frozenset({
+    "success", "error", "source_id", "pages_crawled",
+    "chunks_indexed", "total_tokens", "performance",
+})
+
+
+class _AsyncReader:
+    """Minimal async file-like adapter over aiter_bytes() for ijson."""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size=-1):
+        # ijson probes with read(0) to detect bytes vs str; answering that
+        # probe with a real chunk would silently drop it from the stream.
+        if size == 0:
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _index_request(
+    payload: dict,
+    timeout: float,
+    timeout_msg: str,
+) -> tuple[Optional[dict], Optional[str]]:
+    """Streaming variant of _call_api for the indexing endpoint.
+
+    Large crawls return per-stage and per-page metadata far bigger than the
+    summary the tool displays. When ijson is installed the body is parsed
+    incrementally and only the summary keys are kept, instead of buffering
+    and decoding the whole document; otherwise this falls back to _call_api.
+    """
+    if ijson is None:
+        return await _call_api("/index-documentation", payload, timeout=timeout, timeout_msg=timeout_msg)
+
+    try:
+        _install_auth_header()
+        async with _CLIENT.stream(
+            "POST",
+            "/index-documentation",
+            content=orjson.dumps(payload),
+            timeout=timeout,
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                return None, _http_error(response)
+
+            data = {}
+            async for key, value in ijson.kvitems_async(_AsyncReader(response.aiter_bytes()), ""):
+                if key in _INDEX_SUMMARY_KEYS:
+                    data[key] = value
+            return data, None
+
+    except ValueError as e:
+        return None, f"Configuration error: {str(e)}"
+    except httpx.TimeoutException:
+        return None, timeout_msg
+    except Exception as e:
+        return None, _unexpected_error(e)
+
+
+async def _request(
+    endpoint: str,
+    content: Optional[bytes],
+    timeout: Optional[float] = None,
+    timeout_msg: str = "Error: Request timed out. Please try again.",
+    type_: Optional[type] = None,
+):
+    """Perform a single POST; see _call_api for the error contract."""
+    try:
+        _install_auth_header()
+        response = await _post_json(_CLIENT, endpoint, content, timeout=timeout)
+        _log_http_version(response)
+
+        if not response.is_success:
+            return None, _http_error(response)
+
+        if type_ is not None:
+            return msgspec.json.decode(response.content, type=type_), None
+        return orjson.loads(response.content), None
+
+    except ValueError as e:
+        return None, f"Configuration error: {str(e)}"
+    except httpx.TimeoutException:
+        return None, timeout_msg
+    except Exception as e:
+        return None, _unexpected_error(e)
+
+
+def _render_semantic(query, time_period, match_threshold, results, total, metadata):
+    """Yield the lines of a semantic search response for a single join."""
+    yield f"Semantic Search Results for: '{query}'"
+    yield f"Total results: {total}"
+    if time_period:
+        yield f"Time period: {time_period}"
+    yield f"Similarity threshold: {match_threshold}"
+    yield f"Logs with embeddings: {metadata.get('logs_with_embeddings', 0)}"
+    yield "\n" + _SEP80 + "\n"
+    for i, log in enumerate(islice(results, 10), 1):
+        yield f"{i}. {format_log_result(log)}"
+        yield _DASH80
+    if total > 10:
+        yield f"\n... and {total - 10} more results"
+
+
+async def _semantic_search(
+    query: str,
+    time_period: Optional[str],
+    match_threshold: float,
+    match_count: int,
+) -> str:
+    """Run a semantic log search and return the formatted result."""
+    cache_key = ("semantic", query, time_period, match_threshold, match_count)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Parse time period if provided
+    start_time = None
+    end_time = None
+    if time_period:
+        start_time, end_time = parse_time_period(time_period)
+        if start_time is None:
+            return f"Error: Invalid time period '{time_period}'. Supported values: 5m, 1h, today, yesterday, 7d, etc."
+
+    # Prepare request payload. Only 10 results are ever displayed, so don't
+    # ask the backend to serialize more than that; total_results still
+    # reflects the full match count.
+    payload = {
+        "query": query,
+        "match_threshold": match_threshold,
+        "match_count": min(match_count, 10),
+    }
+
+    # Add time filters if provided (orjson serializes datetimes natively)
+    if start_time:
+        payload["start_time"] = start_time
+    if end_time:
+        payload["end_time"] = end_time
+
+    # Make API request
+    data, err = await _call_api("/search-logs", payload, type_=_LogSearchResponse)
+    if err:
+        return err
+
+    if not data.success:
+        return f"Error: {data.error or 'Unknown error'}"
+
+    results = data.results
+    total = data.total_results
+    metadata = data.search_metadata
+
+    if not results:
+        time_info = f" in period '{time_period}'" if time_period else ""
+        return f"No logs found for query '{query}'{time_info}"
+
+    result = "\n".join(
+        _render_semantic(query, time_period, match_threshold, results, total, metadata)
+    )
+    _search_cache_put(cache_key, result)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def search_logs_semantic(
     query: Annotated[str, "Search query in natural language or keywords"],
     time_period: Annotated[Optional[str], "Time filter: 5m, 1h, today, yesterday, 7d, 30d, etc."] = None,
@@ -45,89 +541,97 @@ async def search_logs_semantic(
 
     This tool performs AI-powered semantic search across your logs, finding relevant entries
     even if they don't contain exact keywords."""
-    try:
-        api_key = get_api_key()
-
-        # Parse time period if provided
-        start_time = None
-        end_time = None
-        if time_period:
-            start_time, end_time = parse_time_period(time_period)
-            if start_time is None:
-                return f"Error: Invalid time period '{time_period}'. Supported values: 5m, 1h, today, yesterday, 7d, etc."
-
-        # Prepare request payload
-        payload = {
-            "query": query,
-            "match_threshold": match_threshold,
-            "match_count": match_count,
-        }
-
-        # Add time filters if provided
-        if start_time:
-            payload["start_time"] = start_time.isoformat()
-        if end_time:
-            payload["end_time"] = end_time.isoformat()
-
-        # Make API request
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{STRAYL_API_URL}/search-logs",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                return f"Error: API returned status {response.status_code}: {error_data.get('error', response.text)}"
-
-            data = response.json()
-
-            if not data.get("success"):
-                return f"Error: {data.get('error', 'Unknown error')}"
-
-            results = data.get("results", [])
-            total = data.get("total_results", 0)
-            metadata = data.get("search_metadata", {})
+    return await _semantic_search(query, time_period, match_threshold, match_count)
 
-            if not results:
-                time_info = f" in period '{time_period}'" if time_period else ""
-                return f"No logs found for query '{query}'{time_info}"
 
-            # Format results
-            output = [
-                f"Semantic Search Results for: '{query}'",
-                f"Total results: {total}",
-            ]
-
-            if time_period:
-                output.append(f"Time period: {time_period}")
+async def _exact_search(
+    query: str,
+    time_period: Optional[str],
+    level: Optional[str],
+    case_sensitive: bool,
+    limit: int,
+) -> str:
+    """Run an exact log search and return the formatted result."""
+    cache_key = ("exact", query, time_period, level, case_sensitive, limit)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Parse time period if provided
+    start_time = None
+    end_time = None
+    if time_period:
+        start_time, end_time = parse_time_period(time_period)
+        if start_time is None:
+            return f"Error: Invalid time period '{time_period}'"
+
+    # Prepare request payload. Only 10 results are ever displayed, so cap
+    # the amount the backend has to serialize.
+    payload = {
+        "query": query,
+        "case_sensitive": case_sensitive,
+        "limit": min(limit, 10),
+    }
+
+    if level:
+        lvl = level.lower()
+        if lvl not in _VALID_LEVELS:
+            return f"Error: Invalid log level '{level}'. Must be one of: info, warn, error, debug"
+        payload["level"] = lvl
+
+    if start_time:
+        payload["start_time"] = start_time
+    if end_time:
+        payload["end_time"] = end_time
+
+    # Make API request to exact search endpoint
+    data, err = await _call_api("/exact-search-logs", payload, type_=_LogSearchResponse)
+    if err:
+        return err
+
+    if not data.success:
+        return f"Error: {data.error or 'Unknown error'}"
+
+    results = data.results
+    total = data.total_results
+
+    if not results:
+        filters = []
+        if time_period:
+            filters.append(f"period '{time_period}'")
+        if level:
+            filters.append(f"level '{level}'")
+        filter_str = f" with filters: {', '.join(filters)}" if filters else ""
+        return f"No logs found for exact text '{query}'{filter_str}"
+
+    # Format results
+    output = [
+        f"Exact Search Results for: '{query}'",
+        f"Total results: {total}",
+    ]
 
-            output.append(f"Similarity threshold: {match_threshold}")
-            output.append(f"Logs with embeddings: {metadata.get('logs_with_embeddings', 0)}")
-            output.append("\n" + "=" * 80 + "\n")
+    if time_period:
+        output.append(f"Time period: {time_period}")
+    if level:
+        output.append(f"Log level: {level}")
 
-            for i, log in enumerate(results[:10], 1):
-                output.append(f"{i}. {format_log_result(log)}")
-                output.append("-" * 80)
+    output.append(f"Case sensitive: {case_sensitive}")
+    output.append("\n" + _SEP80 + "\n")
 
-            if total > 10:
-                output.append(f"\n... and {total - 10} more results")
+    for i, log in enumerate(islice(results, 10), 1):
+        output.append(f"{i}. {format_log_result(log)}")
+        output.append(_DASH80)
 
-            return "\n".join(output)
+    if total > 10:
+        output.append(f"\n... and {total - 10} more results")
 
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out. Please try again."
-    except Exception as e:
-        return f"Error: {str(e)}"
+    result = "\n".join(output)
+    _search_cache_put(cache_key, result)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def search_logs_exact(
     query: Annotated[str, "Exact text to search for. Use '*' or empty string to see all logs"],
     time_period: Annotated[Optional[str], "Time filter: 5m, 1h, today, yesterday, 7d, 30d, etc."] = None,
@@ -139,98 +643,29 @@ async def search_logs_exact(
 
     This tool performs exact text search across your logs. Use '*' as query to view all logs
     with optional filters by time period and log level."""
-    try:
-        api_key = get_api_key()
+    return await _exact_search(query, time_period, level, case_sensitive, limit)
 
-        # Parse time period if provided
-        start_time = None
-        end_time = None
-        if time_period:
-            start_time, end_time = parse_time_period(time_period)
-            if start_time is None:
-                return f"Error: Invalid time period '{time_period}'"
 
-        # Prepare request payload
-        payload = {
-            "query": query,
-            "case_sensitive": case_sensitive,
-            "limit": limit,
-        }
-
-        if level:
-            if level.lower() not in ["info", "warn", "error", "debug"]:
-                return f"Error: Invalid log level '{level}'. Must be one of: info, warn, error, debug"
-            payload["level"] = level.lower()
-
-        if start_time:
-            payload["start_time"] = start_time.isoformat()
-        if end_time:
-            payload["end_time"] = end_time.isoformat()
-
-        # Make API request to exact search endpoint
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{STRAYL_API_URL}/exact-search-logs",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                return f"Error: API returned status {response.status_code}: {error_data.get('error', response.text)}"
-
-            data = response.json()
-
-            if not data.get("success"):
-                return f"Error: {data.get('error', 'Unknown error')}"
-
-            results = data.get("results", [])
-            total = data.get("total_results", 0)
-
-            if not results:
-                filters = []
-                if time_period:
-                    filters.append(f"period '{time_period}'")
-                if level:
-                    filters.append(f"level '{level}'")
-                filter_str = f" with filters: {', '.join(filters)}" if filters else ""
-                return f"No logs found for exact text '{query}'{filter_str}"
-
-            # Format results
-            output = [
-                f"Exact Search Results for: '{query}'",
-                f"Total results: {total}",
-            ]
-
-            if time_period:
-                output.append(f"Time period: {time_period}")
-            if level:
-                output.append(f"Log level: {level}")
-
-            output.append(f"Case sensitive: {case_sensitive}")
-            output.append("\n" + "=" * 80 + "\n")
-
-            for i, log in enumerate(results[:10], 1):
-                output.append(f"{i}. {format_log_result(log)}")
-                output.append("-" * 80)
-
-            if total > 10:
-                output.append(f"\n... and {total - 10} more results")
-
-            return "\n".join(output)
+@mcp.tool()
+@_tool_errors
+async def search_logs_combined(
+    query: Annotated[str, "Search query used for both the semantic and the exact log search"],
+    time_period: Annotated[Optional[str], "Time filter: 5m, 1h, today, yesterday, 7d, 30d, etc."] = None,
+) -> str:
+    """Run semantic and exact log searches for the same query in parallel.
 
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out. Please try again."
-    except Exception as e:
-        return f"Error: {str(e)}"
+    Both searches are issued concurrently over the shared connection, so the
+    combined call takes roughly as long as the slower of the two instead of
+    their sum."""
+    semantic, exact = await asyncio.gather(
+        _semantic_search(query, time_period, 0.2, 50),
+        _exact_search(query, time_period, None, False, 50),
+    )
+    return f"{semantic}\n\n{_SEP80}\n\n{exact}"
 
 
 @mcp.tool()
+@_tool_errors
 async def search_context(
     query: Annotated[str, "Search query in natural language to find relevant information across indexed context sources"],
     memory_id: Annotated[Optional[str], "Optional memory session ID to maintain conversation history and context"] = None,
@@ -251,78 +686,111 @@ async def search_context(
     - Adaptive similarity threshold (auto-adjusts if too few results)
     
     Use manage_context_memory() to create and manage memory sessions for maintaining conversation context."""
-    try:
-        api_key = get_api_key()
+    payload = {
+        "query": query,
+        "limit": 15,  # Фиксированный лимит (не передается пользователем)
+        "similarity_threshold": 0.22,
+        "use_ai": use_ai,
+    }
 
-        payload = {
-            "query": query,
-            "limit": 15,  # Фиксированный лимит (не передается пользователем)
-            "similarity_threshold": 0.22,
-            "use_ai": use_ai,
-        }
+    if memory_id:
+        payload["chat_id"] = memory_id
 
-        if memory_id:
-            payload["chat_id"] = memory_id
-            
-        if source_id:
-            payload["source_id"] = source_id
+    if source_id:
+        payload["source_id"] = source_id
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{STRAYL_API_URL}/search-documentation",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
+    # Without a memory session a duplicate request has no side effects, so
+    # the AI-structured search can race against a fast raw search.
+    if use_ai and not memory_id:
+        return await _context_search_race(payload, query, source_id)
 
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                return f"Error: API returned status {response.status_code}: {error_data.get('error', response.text)}"
+    data, err = await _call_api(
+        "/search-documentation",
+        payload,
+        timeout=60.0,
+        timeout_msg=_GEMINI_TIMEOUT_MSG,
+    )
+    if err:
+        return err
 
-            data = response.json()
+    return _render_context_results(data, query, source_id)
 
-            if "error" in data:
-                return f"Error: {data.get('error', 'Unknown error')}"
 
-            results = data.get("results", [])
-            structured_answer = data.get("structured_answer")
-            metadata = data.get("metadata", {})
-
-            if not results and not structured_answer:
-                source_info = f" in source '{source_id}'" if source_id else ""
-                return f"No documentation found for query '{query}'{source_info}"
-
-            # Минималистичный вывод - только AI ответ или краткие результаты
-            if structured_answer and str(structured_answer).strip():
-                # Просто AI ответ, без заголовков и метаданных
-                return str(structured_answer).strip()
-            
-            # Fallback: краткие результаты если нет AI ответа
-            output = []
-            output.append(f"📚 {len(results)} результат(ов) по запросу: {query}\n")
-            
-            for i, result in enumerate(results, 1):
-                source = result.get("source", {})
-                content = result.get("content", "")[:300]  # Первые 300 символов
-                source_name = source.get("name", "Unknown")
-                
-                output.append(f"{i}. **{source_name}**")
-                output.append(f"   {content}...\n")
-
-            return "\n".join(output)
+_GEMINI_TIMEOUT_MSG = "Error: Request timed out (Gemini processing can take up to 60s). Please try again."
 
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out (Gemini processing can take up to 60s). Please try again."
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+# How much longer to wait for the AI-structured answer once the raw
+# results are already in hand.
+_AI_ANSWER_GRACE = 10.0
+
+
+def _render_context_results(data: dict, query: str, source_id: Optional[str]) -> str:
+    """Format a /search-documentation response for the model."""
+    if "error" in data:
+        return f"Error: {data.get('error', 'Unknown error')}"
+
+    results = data.get("results", [])
+    structured_answer = data.get("structured_answer")
+
+    if not results and not structured_answer:
+        source_info = f" in source '{source_id}'" if source_id else ""
+        return f"No documentation found for query '{query}'{source_info}"
+
+    # Минималистичный вывод - только AI ответ или краткие результаты
+    if structured_answer and str(structured_answer).strip():
+        # Просто AI ответ, без заголовков и метаданных
+        return str(structured_answer).strip()
+
+    # Fallback: краткие результаты если нет AI ответа
+    output = []
+    output.append(f"📚 {len(results)} результат(ов) по запросу: {query}\n")
+
+    for i, result in enumerate(results, 1):
+        source = result.get("source", {})
+        content = result.get("content", "")[:300]  # Первые 300 символов
+        source_name = source.get("name", "Unknown")
+
+        output.append(f"{i}. **{source_name}**")
+        output.append(f"   {content}...\n")
+
+    return "\n".join(output)
+
+
+async def _context_search_race(payload: dict, query: str, source_id: Optional[str]) -> str:
+    """Run raw and AI-structured context searches concurrently.
+
+    The raw search usually returns within a couple of seconds while Gemini
+    post-processing can take tens. Prefer the AI answer when it lands
+    within a short grace window after the raw results; otherwise return
+    the raw results and cancel the slow request.
+    """
+    raw_payload = dict(payload)
+    raw_payload["use_ai"] = False
+
+    ai_task = asyncio.ensure_future(
+        _call_api("/search-documentation", payload, timeout=60.0, timeout_msg=_GEMINI_TIMEOUT_MSG)
+    )
+    raw_data, raw_err = await _call_api("/search-documentation", raw_payload, timeout=60.0)
+
+    try:
+        ai_data, ai_err = await asyncio.wait_for(ai_task, timeout=_AI_ANSWER_GRACE)
+    except asyncio.TimeoutError:
+        ai_data, ai_err = None, None
+
+    if ai_data is not None and ai_err is None:
+        return _render_context_results(ai_data, query, source_id)
+    if raw_err:
+        return ai_err or raw_err
+    return _render_context_results(raw_data, query, source_id)
+
+
+async def _fetch_sources(public: bool):
+    """Fetch a single visibility class of context sources."""
+    payload = {"include_public": public, "include_private": not public}
+    return await _call_api("/list-documentation-sources", payload)
 
 
 @mcp.tool()
+@_tool_errors
 async def list_context_sources(
     include_public: Annotated[bool, "Include community-shared public context sources available to all users"] = True,
     include_private: Annotated[bool, "Include your private context sources (only visible to you)"] = True,
@@ -341,99 +809,66 @@ async def list_context_sources(
     - Public sources: Shared across all users (indexed once, accessible to all)
     
     Use source_id parameter in search_context() to limit searches to specific sources."""
-    try:
-        api_key = get_api_key()
-        
+    cache_key = ("sources", include_public, include_private)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    if include_public and include_private:
+        # Overlap the two visibility lookups: the backend resolves them as
+        # separate queries, and both POSTs share one HTTP/2 connection.
+        responses = await asyncio.gather(
+            _fetch_sources(public=True),
+            _fetch_sources(public=False),
+        )
+        merged = {}
+        for data, err in responses:
+            if err:
+                return err
+            if "error" in data:
+                return f"Error: {data.get('error', 'Unknown error')}"
+            for source in data.get("sources", []):
+                merged[source.get("id")] = source
+        sources = list(merged.values())
+        count = len(sources)
+    else:
         payload = {
             "include_public": include_public,
             "include_private": include_private,
         }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{STRAYL_API_URL}/list-documentation-sources",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-            
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                return f"Error: API returned status {response.status_code}: {error_data.get('error', response.text)}"
-            
-            data = response.json()
-            
-            if "error" in data:
-                return f"Error: {data.get('error', 'Unknown error')}"
-            
-            sources = data.get("sources", [])
-            count = data.get("count", 0)
-            
-            if not sources:
-                filter_info = []
-                if not include_public:
-                    filter_info.append("excluding public")
-                if not include_private:
-                    filter_info.append("excluding private")
-                filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
-                return f"No documentation sources found{filter_str}."
-            
-            output = [
-                "=" * 80,
-                "AVAILABLE DOCUMENTATION SOURCES",
-                "=" * 80,
-                f"Total sources: {count}",
-                f"Filters: Public={'Yes' if include_public else 'No'}, Private={'Yes' if include_private else 'No'}",
-                "",
-            ]
-            
-            for i, source in enumerate(sources, 1):
-                source_id = source.get("id", "Unknown")
-                name = source.get("name", "Unnamed")
-                url = source.get("url", "N/A")
-                status = source.get("status", "unknown")
-                chunks_count = source.get("chunks_count", 0)
-                indexed_at = source.get("indexed_at", "")
-                is_public = source.get("is_public", False)
-                
-                date_str = ""
-                if indexed_at:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(indexed_at.replace('Z', '+00:00'))
-                        date_str = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        date_str = indexed_at[:10]
-                
-                output.append(f"{i}. {name}")
-                output.append(f"   ID: {source_id}")
-                output.append(f"   URL: {url}")
-                output.append(f"   Status: {status.upper()}")
-                output.append(f"   Public: {'Yes' if is_public else 'No (Your private source)'}")
-                if chunks_count:
-                    output.append(f"   Chunks: {chunks_count}")
-                if date_str:
-                    output.append(f"   Indexed: {date_str}")
-                output.append("")
-            
-            output.append("=" * 80)
-            output.append("\nTip: Use source_id to search within a specific context source")
-            output.append("   Example: search_context('query', source_id='uuid-here')")
-            
-            return "\n".join(output)
-            
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out. Please try again."
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+        data, err = await _call_api("/list-documentation-sources", payload)
+        if err:
+            return err
+
+        if "error" in data:
+            return f"Error: {data.get('error', 'Unknown error')}"
+
+        sources = data.get("sources", [])
+        count = data.get("count", 0)
+
+    if not sources:
+        filter_info = []
+        if not include_public:
+            filter_info.append("excluding public")
+        if not include_private:
+            filter_info.append("excluding private")
+        filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
+        return f"No documentation sources found{filter_str}."
+
+    header = (
+        f"{_SOURCES_BANNER}"
+        f"Total sources: {count}\n"
+        f"Filters: Public={'Yes' if include_public else 'No'}, Private={'Yes' if include_private else 'No'}\n"
+    )
+    body = "\n".join(_format_source(i, source) for i, source in enumerate(sources, 1))
+    result = header + "\n" + body + _SOURCES_FOOTER
+    _list_cache_put(cache_key, result)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def index_context(
     url: Annotated[str, "Full URL of the content to index (e.g., https://docs.example.com or https://example.com/knowledge-base)"],
     is_public: Annotated[bool, "Make this source public (accessible to all users) or private (only you)"] = True,
@@ -463,84 +898,68 @@ async def index_context(
     Performance: Indexing duration depends on content size (typically 1-5 minutes for standard docs).
     
     After indexing, use search_context() to query the indexed content."""
-    try:
-        api_key = get_api_key()
-        
-        payload = {
-            "url": url,
-            "is_public": is_public,
-            "force": force,
-        }
-        
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(
-                f"{STRAYL_API_URL}/index-documentation",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-            
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                error_msg = error_data.get('error', response.text)
-                return f"Error: API returned status {response.status_code}: {error_msg}"
-            
-            data = response.json()
-            
-            if "error" in data:
-                return f"Error: {data.get('error', 'Unknown error')}"
-            
-            if data.get("success"):
-                source_id_returned = data.get("source_id", "")
-                pages_crawled = data.get("pages_crawled", 0)
-                chunks_indexed = data.get("chunks_indexed", 0)
-                total_tokens = data.get("total_tokens", 0)
-                performance = data.get("performance", {})
-                
-                output = [
-                    "=" * 80,
-                    "CONTEXT SOURCE ADDED & INDEXED",
-                    "=" * 80,
-                    f"URL: {url}",
-                    f"Source ID: {source_id_returned}",
-                    f"Public: {'Yes' if is_public else 'No (Private)'}",
-                    f"Pages crawled: {pages_crawled}",
-                    f"Chunks indexed: {chunks_indexed}",
-                    f"Total tokens: {total_tokens:,}",
-                ]
-                
-                if performance:
-                    total_duration = performance.get("total_duration_ms", 0)
-                    stages = performance.get("stages", {})
-                    
-                    output.append(f"\nTotal duration: {total_duration / 1000:.2f}s")
-                    
-                    if stages:
-                        output.append("\nStage timings:")
-                        for stage, duration in stages.items():
-                            output.append(f"  - {stage}: {duration / 1000:.2f}s")
-                
-                output.append("\n" + "=" * 80)
-                output.append("The documentation is now searchable!")
-                output.append(f"   Use: search_documentation('your query here')")
-                output.append(f"   Or: search_documentation('your query', source_id='{source_id_returned}')")
-                
-                return "\n".join(output)
-            else:
-                return f"Error: Indexing failed. {data.get('error', 'Unknown error')}"
-            
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out. Indexing can take several minutes. Please check the status later."
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+    payload = {
+        "url": url,
+        "is_public": is_public,
+        "force": force,
+    }
+
+    data, err = await _index_request(
+        payload,
+        timeout=300.0,
+        timeout_msg="Error: Request timed out. Indexing can take several minutes. Please check the status later.",
+    )
+    if err:
+        return err
+
+    if "error" in data:
+        return f"Error: {data.get('error', 'Unknown error')}"
+
+    if data.get("success"):
+        # A new source invalidates the cached listings
+        _LIST_CACHE.clear()
+        source_id_returned = data.get("source_id", "")
+        pages_crawled = data.get("pages_crawled", 0)
+        chunks_indexed = data.get("chunks_indexed", 0)
+        total_tokens = data.get("total_tokens", 0)
+        performance = data.get("performance", {})
+
+        output = [
+            _SEP80,
+            "CONTEXT SOURCE ADDED & INDEXED",
+            _SEP80,
+            f"URL: {url}",
+            f"Source ID: {source_id_returned}",
+            f"Public: {'Yes' if is_public else 'No (Private)'}",
+            f"Pages crawled: {pages_crawled}",
+            f"Chunks indexed: {chunks_indexed}",
+            f"Total tokens: {total_tokens:,}",
+        ]
+
+        if performance:
+            total_duration = performance.get("total_duration_ms", 0)
+            stages = performance.get("stages", {})
+
+            output.append(f"\nTotal duration: {total_duration / 1000:.2f}s")
+
+            if stages:
+                output.append("\nStage timings:")
+                output.extend(f"  - {stage}: {duration / 1000:.2f}s" for stage, duration in stages.items())
+
+        output.extend((
+            "\n" + _SEP80,
+            "The documentation is now searchable!",
+            "   Use: search_documentation('your query here')",
+            f"   Or: search_documentation('your query', source_id='{source_id_returned}')",
+        ))
+
+        return "\n".join(output)
+    else:
+        return f"Error: Indexing failed. {data.get('error', 'Unknown error')}"
 
 
 @mcp.tool()
+@_tool_errors
 async def manage_context_memory(
     action: Annotated[str, "Action to perform: 'list' (show all), 'create' (new memory), 'get' (view history), 'delete' (remove memory)"],
     title: Annotated[Optional[str], "Memory session title - descriptive name for the conversation thread (required for 'create')"] = None,
@@ -564,109 +983,60 @@ async def manage_context_memory(
     3. View history: manage_context_memory(action='get', memory_id='uuid')
     
     Security: All memories are user-scoped via Row Level Security (RLS) - you can only access your own memories."""
-    try:
-        api_key = get_api_key()
-        
-        # Валидация параметров
-        if action == 'create' and not title:
-            return "Error: 'title' is required for creating a memory"
-        
-        if action in ['get', 'delete'] and not memory_id:
-            return f"Error: 'memory_id' is required for action '{action}'"
-        
-        # Формируем URL с параметрами
-        url = f"{STRAYL_API_URL}/manage-documentation-chats?action={action}"
-        
-        if action == 'get' or action == 'delete':
-            url += f"&chat_id={memory_id}"
-        
-        # Подготавливаем body для POST запроса (для create)
-        body = None
-        if action == 'create':
-            body = {"title": title}
-            if source_id:
-                body["source_id"] = source_id
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if body:
-                response = await client.post(
-                    url,
-                    json=body,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-            else:
-                # Для list, get, delete используем GET (можно POST с пустым body)
-                response = await client.post(
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-            
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-                return f"Error: API returned status {response.status_code}: {error_data.get('error', response.text)}"
-            
-            data = response.json()
-            
-            if "error" in data:
-                return f"Error: {data.get('error', 'Unknown error')}"
-            
-            # Форматируем ответ в зависимости от действия
-            if action == 'list':
-                chats = data.get("chats", [])
-                count = data.get("count", 0)
-                
-                if not chats:
-                    return "No memories found. Create a new memory with action='create'."
-                
-                output = [
-                    "=" * 80,
-                    "YOUR CONTEXT MEMORIES",
-                    "=" * 80,
-                    f"Total memories: {count}",
-                    "",
-                ]
-                
-                for i, chat in enumerate(chats, 1):
-                    chat_id_val = chat.get("id", "Unknown")
-                    title_val = chat.get("title", "Untitled")
-                    updated = chat.get("updated_at", "")
-                    source = chat.get("documentation_sources")
-                    
-                    date_str = ""
-                    if updated:
-                        try:
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-                            date_str = dt.strftime("%Y-%m-%d %H:%M")
-                        except:
-                            date_str = updated[:16]
-                    
-                    output.append(f"{i}. {title_val}")
-                    output.append(f"   ID: {chat_id_val}")
-                    if source:
-                        output.append(f"   Source: {source.get('name', 'N/A')}")
-                    if date_str:
-                        output.append(f"   Updated: {date_str}")
-                    output.append("")
-                
-                output.append("=" * 80)
-                output.append("\nTip: Use memory_id with search_context to continue conversation")
-                output.append("   Example: search_context('query', memory_id='uuid-here')")
-                
-                return "\n".join(output)
-            
-            elif action == 'create':
-                chat = data.get("chat", {})
-                memory_id_val = chat.get("id", "Unknown")
-                title_val = chat.get("title", "Untitled")
-                
-                return f"""✅ Memory created successfully!
+    # Валидация параметров
+    if action == 'create' and not title:
+        return "Error: 'title' is required for creating a memory"
+
+    if action in ['get', 'delete'] and not memory_id:
+        return f"Error: 'memory_id' is required for action '{action}'"
+
+    if action == 'list':
+        cached = _list_cache_get(("memories",))
+        if cached is not None:
+            return cached
+
+    # Формируем URL с параметрами (base_url задан на общем клиенте)
+    url = f"/manage-documentation-chats?action={action}"
+
+    if action == 'get' or action == 'delete':
+        url += f"&chat_id={memory_id}"
+
+    # Подготавливаем body для POST запроса (для create)
+    body = None
+    if action == 'create':
+        body = {"title": title}
+        if source_id:
+            body["source_id"] = source_id
+
+    # Для list, get, delete body отсутствует (POST с пустым body)
+    data, err = await _call_api(url, body)
+    if err:
+        return err
+
+    if "error" in data:
+        return f"Error: {data.get('error', 'Unknown error')}"
+
+    # Форматируем ответ в зависимости от действия
+    if action == 'list':
+        chats = data.get("chats", [])
+        count = data.get("count", 0)
+
+        if not chats:
+            return "No memories found. Create a new memory with action='create'."
+
+        header = _MEMORIES_BANNER + f"Total memories: {count}\n"
+        body = "\n".join(_format_memory(i, chat) for i, chat in enumerate(chats, 1))
+        result = header + "\n" + body + _MEMORIES_FOOTER
+        _list_cache_put(("memories",), result)
+        return result
+
+    elif action == 'create':
+        _LIST_CACHE.pop(("memories",), None)
+        chat = data.get("chat", {})
+        memory_id_val = chat.get("id", "Unknown")
+        title_val = chat.get("title", "Untitled")
+
+        return f"""✅ Memory created successfully!
 
 Title: {title_val}
 Memory ID: {memory_id_val}
@@ -674,59 +1044,49 @@ Memory ID: {memory_id_val}
 Use this memory_id with search_context to save conversation history:
   search_context('your query', memory_id='{memory_id_val}')
 """
-            
-            elif action == 'get':
-                chat = data.get("chat", {})
-                messages = data.get("messages", [])
-                count = data.get("count", 0)
-                
-                title_val = chat.get("title", "Untitled")
-                
-                output = [
-                    "=" * 80,
-                    f"MEMORY: {title_val}",
-                    "=" * 80,
-                    f"Messages: {count}",
-                    "",
-                ]
-                
-                if not messages:
-                    output.append("No context in this memory yet.")
-                else:
-                    for i, msg in enumerate(messages, 1):
-                        role = msg.get("role", "unknown")
-                        content = msg.get("content", "")
-                        created = msg.get("created_at", "")
-                        
-                        date_str = ""
-                        if created:
-                            try:
-                                from datetime import datetime
-                                dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                                date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                            except:
-                                date_str = created[:19]
-                        
-                        role_emoji = "👤" if role == "user" else "🤖"
-                        output.append(f"{role_emoji} {role.upper()} [{date_str}]")
-                        output.append(f"{content}")
-                        output.append("-" * 80)
-                
-                return "\n".join(output)
-            
-            elif action == 'delete':
-                return f"✅ Memory deleted successfully (ID: {memory_id})"
-            
-            else:
-                return f"Unknown action: {action}"
-                
-    except ValueError as e:
-        return f"Configuration error: {str(e)}"
-    except httpx.TimeoutException:
-        return "Error: Request timed out. Please try again."
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+    elif action == 'get':
+        chat = data.get("chat", {})
+        messages = data.get("messages", [])
+        count = data.get("count", 0)
+
+        title_val = chat.get("title", "Untitled")
+
+        # Histories can run to hundreds of long messages; write into one
+        # buffer instead of accumulating per-line strings for a final join.
+        buf = io.StringIO()
+        w = buf.write
+        w(f"{_SEP80}\nMEMORY: {title_val}\n{_SEP80}\nMessages: {count}\n")
+
+        if not messages:
+            w("\nNo context in this memory yet.")
+        else:
+            for msg in messages:
+                role = msg.get("role", "unknown")
+                content = msg.get("content", "")
+                created = msg.get("created_at", "")
+
+                date_str = ""
+                if created:
+                    try:
+                        date_str = format_timestamp(created, with_seconds=True)
+                    except:
+                        date_str = created[:19]
+
+                role_emoji = "👤" if role == "user" else "🤖"
+                w(f"\n{role_emoji} {role.upper()} [{date_str}]\n")
+                w(content)
+                w("\n")
+                w(_DASH80)
+
+        return buf.getvalue()
+
+    elif action == 'delete':
+        _LIST_CACHE.pop(("memories",), None)
+        return f"✅ Memory deleted successfully (ID: {memory_id})"
+
+    else:
+        return f"Unknown action: {action}"
 
 
 @mcp.tool()
@@ -737,28 +1097,4 @@ def list_time_periods() -> str:
     Returns:
         A formatted list of all supported time period values
     """
-    return """Supported time periods for log search:
-
-Minutes:
-  - 5m, 5_minutes, 5_mins - Last 5 minutes
-  - 10m, 10_minutes - Last 10 minutes
-  - 15m, 15_minutes - Last 15 minutes
-  - 30m, 30_minutes - Last 30 minutes
-
-Hours:
-  - 1h, 1_hour - Last 1 hour
-  - 2h, 2_hours - Last 2 hours
-  - 6h, 6_hours - Last 6 hours
-  - 12h, 12_hours - Last 12 hours
-  - 24h, last_24_hours - Last 24 hours
-
-Days:
-  - today - Today from 00:00 UTC
-  - yesterday - Full yesterday (00:00 to 23:59)
-  - 7d, last_7_days - Last 7 days
-  - 30d, last_30_days - Last 30 days
-
-Examples:
-  - search_logs_semantic("error connecting to database", "1h")
-  - search_logs_exact("timeout", "today", level="error")
-"""
\ No newline at end of file
+    return _TIME_PERIODS_HELP
\ No newline at end of file
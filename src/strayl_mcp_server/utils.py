@@ -3,6 +3,32 @@
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
+try:
+    # Optional accelerator: C-level ISO-8601 parsing, handles 'Z' natively
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+
+# Relative periods precompiled once: parse_time_period runs on every search
+# request over a small fixed vocabulary, so lookup beats an if/elif chain.
+_PERIOD_DELTAS = {}
+for _aliases, _delta in (
+    (("5_minutes", "5_mins", "5m"), timedelta(minutes=5)),
+    (("10_minutes", "10_mins", "10m"), timedelta(minutes=10)),
+    (("15_minutes", "15_mins", "15m"), timedelta(minutes=15)),
+    (("30_minutes", "30_mins", "30m"), timedelta(minutes=30)),
+    (("1_hour", "1h"), timedelta(hours=1)),
+    (("2_hours", "2h"), timedelta(hours=2)),
+    (("6_hours", "6h"), timedelta(hours=6)),
+    (("12_hours", "12h"), timedelta(hours=12)),
+    (("last_24_hours", "24h"), timedelta(hours=24)),
+    (("last_7_days", "7d"), timedelta(days=7)),
+    (("last_30_days", "30d"), timedelta(days=30)),
+):
+    for _alias in _aliases:
+        _PERIOD_DELTAS[_alias] = _delta
+
 
 def parse_time_period(period: str) -> Tuple[Optional[datetime], Optional[datetime]]:
     """
@@ -23,30 +49,13 @@ def parse_time_period(period: str) -> Tuple[Optional[datetime], Optional[datetim
     now = datetime.utcnow()
     period = period.lower().strip()
 
-    # Minutes
-    if period in ["5_minutes", "5_mins", "5m"]:
-        return now - timedelta(minutes=5), now
-    elif period in ["10_minutes", "10_mins", "10m"]:
-        return now - timedelta(minutes=10), now
-    elif period in ["15_minutes", "15_mins", "15m"]:
-        return now - timedelta(minutes=15), now
-    elif period in ["30_minutes", "30_mins", "30m"]:
-        return now - timedelta(minutes=30), now
-
-    # Hours
-    elif period in ["1_hour", "1h"]:
-        return now - timedelta(hours=1), now
-    elif period in ["2_hours", "2h"]:
-        return now - timedelta(hours=2), now
-    elif period in ["6_hours", "6h"]:
-        return now - timedelta(hours=6), now
-    elif period in ["12_hours", "12h"]:
-        return now - timedelta(hours=12), now
-    elif period in ["last_24_hours", "24h"]:
-        return now - timedelta(hours=24), now
-
-    # Days
-    elif period == "today":
+    # Relative periods: single dict lookup plus one subtraction
+    delta = _PERIOD_DELTAS.get(period)
+    if delta is not None:
+        return now - delta, now
+
+    # Calendar periods
+    if period == "today":
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         return start_of_day, now
     elif period == "yesterday":
@@ -54,15 +63,25 @@ def parse_time_period(period: str) -> Tuple[Optional[datetime], Optional[datetim
         start_of_yesterday = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_yesterday = start_of_yesterday + timedelta(days=1) - timedelta(microseconds=1)
         return start_of_yesterday, end_of_yesterday
-    elif period in ["last_7_days", "7d"]:
-        return now - timedelta(days=7), now
-    elif period in ["last_30_days", "30d"]:
-        return now - timedelta(days=30), now
 
     # Invalid period
     return None, None
 
 
+def format_timestamp(value: str, with_seconds: bool = False) -> str:
+    """
+    Format an ISO-8601 timestamp as "YYYY-MM-DD HH:MM" (optionally with seconds).
+
+    Backend timestamps have a stable shape, so the common case is a couple
+    of slices; anything unexpected falls back to a full parse.
+    """
+    end = 19 if with_seconds else 16
+    if len(value) >= end and value[10] == "T":
+        return value[:10] + " " + value[11:end]
+    fmt = "%Y-%m-%d %H:%M:%S" if with_seconds else "%Y-%m-%d %H:%M"
+    return parse_datetime(value).strftime(fmt)
+
+
 def format_log_result(log: dict) -> str:
     """Format a log entry for display."""
     timestamp = log.get("created_at", "Unknown time")